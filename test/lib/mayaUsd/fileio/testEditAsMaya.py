@@ -18,12 +18,13 @@
 
 import fixturesUtils
 
-from usdUtils import createSimpleXformScene, createDuoXformScene
+from usdUtils import createSimpleStage, createSimpleXformScene, createDuoXformScene
 
 from maya import OpenMaya as OM
 from maya import OpenMayaAnim as OMA
 
 import mayaUsd.lib
+from mayaUsd.lib import PrimUpdaterManager
 
 import ufeUtils
 import mayaUtils
@@ -41,9 +42,12 @@ import unittest
 
 from testUtils import assertVectorAlmostEqual
 
+import itertools
 import os
 import sys
 
+_HAS_ORPHANED_NODES_MANAGER = os.getenv('HAS_ORPHANED_NODES_MANAGER', '0') == '1'
+
 class EditAsMayaTestCase(unittest.TestCase):
     '''Test edit as Maya: bring USD data into Maya to edit.
 
@@ -61,6 +65,20 @@ class EditAsMayaTestCase(unittest.TestCase):
         if not cls.pluginsLoaded:
             cls.pluginsLoaded = mayaUtils.isMayaUsdPluginLoaded()
 
+        # Build the xform scenes once and keep their layer contents as
+        # templates, so that tests only need to import them into a new stage.
+        cls._simpleScene = cls._exportScene(createSimpleXformScene)
+        cls._duoScene = cls._exportScene(createDuoXformScene)
+
+        # The Maya run-time is only registered once Maya is initialized, so
+        # its UI info handler is looked up here rather than at import time.
+        if ufeUtils.ufeFeatureSetVersion() >= 4:
+            cls._mayaUIInfo = ufe.UIInfoHandler.uiInfoHandler(
+                ufe.RunTimeMgr.instance().getId('Maya-DG'))
+
+        # Selection list reused by _dagPath() to resolve DAG paths.
+        cls._selList = om.MSelectionList()
+
     @classmethod
     def tearDownClass(cls):
         standalone.uninitialize()
@@ -68,122 +86,216 @@ class EditAsMayaTestCase(unittest.TestCase):
     def setUp(self):
         cmds.file(new=True, force=True)
 
+    def _dagPath(self, pathStr):
+        '''Return the DAG path for the given Maya path string.'''
+        self._selList.clear()
+        self._selList.add(pathStr)
+        return self._selList.getDagPath(0)
+
+    def _getPullUfePath(self, dagPath):
+        '''Return the pulled prim UFE path stored on the given edited Maya node,
+        reading the plug directly rather than through the getAttr command.'''
+        depFn = om.MFnDependencyNode(dagPath.node())
+        return depFn.findPlug("Pull_UfePath", False).asString()
+
+    def _assertXformMatches(self, dagPath, xlateOp, xlation, usdUfePathStr):
+        '''Verify that the local transformation of the given edited Maya
+        transform is only the translation of the given USD translate op.'''
+        fn = om.MFnTransform(dagPath)
+        assertVectorAlmostEqual(self, fn.translation(om.MSpace.kObject), xlation)
+        mayaMatrix = fn.transformation().asMatrix()
+        usdMatrix = xlateOp.GetOpTransform(mayaUsd.ufe.getTime(usdUfePathStr))
+
+        # Compare the flattened matrices in a single pass, without
+        # building intermediate lists.
+        assertVectorAlmostEqual(self, mayaMatrix, itertools.chain.from_iterable(usdMatrix))
+
+    def _createLocator(self, name):
+        '''Create a locator transform and shape directly with createNode,
+        avoiding the CreateLocator runtime command. Returns the transform name.'''
+        xform = cmds.createNode('transform', name=name)
+        cmds.createNode('locator', name=name + 'Shape', parent=xform)
+        return xform
+
+    @staticmethod
+    def _exportScene(createScene):
+        '''Create a scene with the given usdUtils function in a new Maya scene
+        and return its root layer contents as a string.'''
+        cmds.file(new=True, force=True)
+        ps = createScene()[0]
+        stage = mayaUsd.ufe.getStage(ufe.PathString.string(ps.path()))
+        return stage.GetRootLayer().ExportToString()
+
+    def _importScene(self, scene):
+        '''Create a new stage and import the given cached scene template in its
+        root layer. Returns the proxy shape UFE path string and UFE item.'''
+        (psPathStr, psPath, ps) = createSimpleStage()
+        mayaUsd.ufe.getStage(psPathStr).GetRootLayer().ImportFromString(scene)
+        return (psPathStr, ps)
+
+    def _makeXformScene(self, scene, bUsdPathStr):
+        '''Import the given cached scene template, which must contain the
+        /A prim and the B prim at the given path, each with a translate op.
+
+        Returns the same tuple as usdUtils.createSimpleXformScene().
+        '''
+        (psPathStr, ps) = self._importScene(scene)
+        stage = mayaUsd.ufe.getStage(psPathStr)
+
+        aXlateOp = UsdGeom.Xformable(stage.GetPrimAtPath('/A')).GetOrderedXformOps()[0]
+        aXlation = aXlateOp.Get()
+        aUsdUfePathStr = psPathStr + ',/A'
+        aUsdUfePath = ufe.PathString.path(aUsdUfePathStr)
+        aUsdItem = ufe.Hierarchy.createItem(aUsdUfePath)
+
+        bXlateOp = UsdGeom.Xformable(stage.GetPrimAtPath(bUsdPathStr)).GetOrderedXformOps()[0]
+        bXlation = bXlateOp.Get()
+        bUsdUfePathStr = psPathStr + ',' + bUsdPathStr
+        bUsdUfePath = ufe.PathString.path(bUsdUfePathStr)
+        bUsdItem = ufe.Hierarchy.createItem(bUsdUfePath)
+
+        return (ps,
+                aXlateOp, aXlation, aUsdUfePathStr, aUsdUfePath, aUsdItem,
+                bXlateOp, bXlation, bUsdUfePathStr, bUsdUfePath, bUsdItem)
+
+    def _makeSimpleXformSceneLite(self):
+        '''Import the cached simple scene template into a new stage.
+
+        Returns a tuple of:
+            - proxy shape UFE item
+            - A UFE path string
+            - B UFE path string
+
+        Tests that only need the path strings should use this rather than
+        _makeSimpleXformScene(), to avoid holding on to USD and UFE objects.
+        '''
+        (psPathStr, ps) = self._importScene(self._simpleScene)
+        aUsdUfePathStr = psPathStr + ',/A'
+        bUsdUfePathStr = aUsdUfePathStr + '/B'
+        return (ps, aUsdUfePathStr, bUsdUfePathStr)
+
+    def _makeSimpleXformScene(self):
+        '''Equivalent to usdUtils.createSimpleXformScene(), but imports the
+        cached scene template instead of re-creating the prims.'''
+        return self._makeXformScene(self._simpleScene, '/A/B')
+
+    def _makeDuoXformScene(self):
+        '''Equivalent to usdUtils.createDuoXformScene(), but imports the
+        cached scene template instead of re-creating the prims.'''
+        return self._makeXformScene(self._duoScene, '/B')
+
     def testCannotEditAsMayaAnAncestor(self):
         '''Test that trying to edit an ancestor is not allowed.'''
 
-        (ps, aXlateOp, aXlation, aUsdUfePathStr, aUsdUfePath, aUsdItem,
-             bXlateOp, bXlation, bUsdUfePathStr, bUsdUfePath, bUsdItem) = createSimpleXformScene()
+        (_, aUsdUfePathStr, bUsdUfePathStr) = self._makeSimpleXformSceneLite()
 
         # Edit "B" Prim as Maya data.
+        self.assertTrue(PrimUpdaterManager.canEditAsMaya(bUsdUfePathStr))
         with mayaUsd.lib.OpUndoItemList():
-            self.assertTrue(mayaUsd.lib.PrimUpdaterManager.canEditAsMaya(bUsdUfePathStr))
-            self.assertTrue(mayaUsd.lib.PrimUpdaterManager.editAsMaya(bUsdUfePathStr))
+            self.assertTrue(PrimUpdaterManager.editAsMaya(bUsdUfePathStr))
 
         # Verify that its ancestor "A" Prim cannot be edited as Maya data.
+        self.assertFalse(PrimUpdaterManager.canEditAsMaya(aUsdUfePathStr))
         with mayaUsd.lib.OpUndoItemList():
-            self.assertFalse(mayaUsd.lib.PrimUpdaterManager.canEditAsMaya(aUsdUfePathStr))
-            self.assertFalse(mayaUsd.lib.PrimUpdaterManager.editAsMaya(aUsdUfePathStr))
+            self.assertFalse(PrimUpdaterManager.editAsMaya(aUsdUfePathStr))
 
-    @unittest.skipIf(os.getenv('HAS_ORPHANED_NODES_MANAGER', '0') != '1', 'Test only available when UFE supports the orphaned nodes manager')
+    @unittest.skipUnless(_HAS_ORPHANED_NODES_MANAGER, 'Test only available when UFE supports the orphaned nodes manager')
     def testRenameAncestorOfEditAsMaya(self):
         '''Test that renaming an ancestor correctly updates the internal data.'''
 
-        (_, _, _, aUsdUfePathStr, aUsdUfePath, _,
-             _, _, _, _, _) = createSimpleXformScene()
+        (_, aUsdUfePathStr, _) = self._makeSimpleXformSceneLite()
 
         # Edit "A" Prim as Maya data.
+        self.assertTrue(PrimUpdaterManager.canEditAsMaya(aUsdUfePathStr))
         with mayaUsd.lib.OpUndoItemList():
-            self.assertTrue(mayaUsd.lib.PrimUpdaterManager.canEditAsMaya(aUsdUfePathStr))
-            self.assertTrue(mayaUsd.lib.PrimUpdaterManager.editAsMaya(aUsdUfePathStr))
+            self.assertTrue(PrimUpdaterManager.editAsMaya(aUsdUfePathStr))
 
-        def validateEditAsMayaMetadata():
+        # The path mapping handler depends only on the Maya run-time, so
+        # resolve it once rather than on every validation.
+        mayaToUsd = ufe.PathMappingHandler.pathMappingHandler(ufe.GlobalSelection.get().front())
+
+        def validateEditAsMayaMetadata(mayaToUsd=mayaToUsd):
             aMayaItem = ufe.GlobalSelection.get().front()
             aMayaPath = aMayaItem.path()
+            aMayaPathStr = ufe.PathString.string(aMayaPath)
             self.assertEqual(aMayaPath.nbSegments(), 1)
-            mayaToUsd = ufe.PathMappingHandler.pathMappingHandler(aMayaItem)
             aFromHostUfePath = mayaToUsd.fromHost(aMayaPath)
             self.assertEqual(ufe.PathString.string(aFromHostUfePath), aUsdUfePathStr)
-            aDagPath = om.MSelectionList().add(ufe.PathString.string(aMayaPath)).getDagPath(0)
-            aPullUfePath = cmds.getAttr(str(aDagPath) + ".Pull_UfePath")
+            aDagPath = self._dagPath(aMayaPathStr)
+            aPullUfePath = self._getPullUfePath(aDagPath)
             self.assertEqual(aPullUfePath, aUsdUfePathStr)
-            self.assertFalse(mayaUsd.lib.PrimUpdaterManager.canEditAsMaya(aUsdUfePathStr))
+            self.assertFalse(PrimUpdaterManager.canEditAsMaya(aUsdUfePathStr))
 
         validateEditAsMayaMetadata()
 
         cmds.rename("stage1", "waka")
 
-        aUsdUfePathStr = aUsdUfePathStr.replace("stage1", "waka").replace("stageShape1", "wakaShape")
+        # Only the proxy shape segment of the UFE path is affected by the rename.
+        proxyShapePathStr, _, primPathStr = aUsdUfePathStr.partition(',')
+        proxyShapePathStr = proxyShapePathStr.replace("stage1", "waka").replace("stageShape1", "wakaShape")
+        aUsdUfePathStr = proxyShapePathStr + ',' + primPathStr
         validateEditAsMayaMetadata()
 
         # Verify we can merge "A" Maya data after the rename of the stage.
         with mayaUsd.lib.OpUndoItemList():
             aMayaItem = ufe.GlobalSelection.get().front()
             aMayaPath = aMayaItem.path()
-            self.assertTrue(mayaUsd.lib.PrimUpdaterManager.mergeToUsd(ufe.PathString.string(aMayaPath)))
+            self.assertTrue(PrimUpdaterManager.mergeToUsd(ufe.PathString.string(aMayaPath)))
 
-    @unittest.skipIf(os.getenv('HAS_ORPHANED_NODES_MANAGER', '0') != '1', 'Test only available when UFE supports the orphaned nodes manager')
+    @unittest.skipUnless(_HAS_ORPHANED_NODES_MANAGER, 'Test only available when UFE supports the orphaned nodes manager')
     def testReparentAncestorOfEditAsMaya(self):
         '''Test that reparenting an ancestor correctly updates the internal data.'''
 
-        cmds.CreateLocator()
-        locName = "locator1"
-        
-        (_, _, _, aUsdUfePathStr, aUsdUfePath, _,
-             _, _, _, _, _) = createSimpleXformScene()
+        locName = self._createLocator("locator1")
+
+        (_, aUsdUfePathStr, _) = self._makeSimpleXformSceneLite()
 
         # Edit "A" Prim as Maya data.
+        self.assertTrue(PrimUpdaterManager.canEditAsMaya(aUsdUfePathStr))
         with mayaUsd.lib.OpUndoItemList():
-            self.assertTrue(mayaUsd.lib.PrimUpdaterManager.canEditAsMaya(aUsdUfePathStr))
-            self.assertTrue(mayaUsd.lib.PrimUpdaterManager.editAsMaya(aUsdUfePathStr))
+            self.assertTrue(PrimUpdaterManager.editAsMaya(aUsdUfePathStr))
 
-        def validateEditAsMayaMetadata():
+        mayaToUsd = ufe.PathMappingHandler.pathMappingHandler(ufe.GlobalSelection.get().front())
+
+        def validateEditAsMayaMetadata(mayaToUsd=mayaToUsd):
             aMayaItem = ufe.GlobalSelection.get().front()
             aMayaPath = aMayaItem.path()
+            aMayaPathStr = ufe.PathString.string(aMayaPath)
             self.assertEqual(aMayaPath.nbSegments(), 1)
-            mayaToUsd = ufe.PathMappingHandler.pathMappingHandler(aMayaItem)
             aFromHostUfePath = mayaToUsd.fromHost(aMayaPath)
             self.assertEqual(ufe.PathString.string(aFromHostUfePath), aUsdUfePathStr)
-            aDagPath = om.MSelectionList().add(ufe.PathString.string(aMayaPath)).getDagPath(0)
-            aPullUfePath = cmds.getAttr(str(aDagPath) + ".Pull_UfePath")
+            aDagPath = self._dagPath(aMayaPathStr)
+            aPullUfePath = self._getPullUfePath(aDagPath)
             self.assertEqual(aPullUfePath, aUsdUfePathStr)
-            self.assertFalse(mayaUsd.lib.PrimUpdaterManager.canEditAsMaya(aUsdUfePathStr))
+            self.assertFalse(PrimUpdaterManager.canEditAsMaya(aUsdUfePathStr))
 
         validateEditAsMayaMetadata()
 
-        # Note: the parent command changes the selection, so preserve and restore it.
-        selToPreserve = ufe.GlobalSelection.get().front()
-        self.assertTrue(mayaUsd.lib.PrimUpdaterManager.discardEdits("A"))
-        cmds.parent("stage1", locName)
-        ufe.GlobalSelection.get().clear()
-        ufe.GlobalSelection.get().append(selToPreserve)
+        self.assertTrue(PrimUpdaterManager.discardEdits("A"))
+
+        # Reparent through a DAG modifier rather than the parent command: the
+        # stage map is still updated by the DAG messages, but the selection
+        # is left untouched, so it does not need to be preserved.
+        dagModifier = om.MDagModifier()
+        dagModifier.reparentNode(self._dagPath("stage1").node(), self._dagPath(locName).node())
+        dagModifier.doIt()
 
         # Edit "A" Prim as Maya data.
         aUsdUfePathStr = "|" + locName + aUsdUfePathStr
+        self.assertTrue(PrimUpdaterManager.canEditAsMaya(aUsdUfePathStr))
         with mayaUsd.lib.OpUndoItemList():
-            self.assertTrue(mayaUsd.lib.PrimUpdaterManager.canEditAsMaya(aUsdUfePathStr))
-            self.assertTrue(mayaUsd.lib.PrimUpdaterManager.editAsMaya(aUsdUfePathStr))
+            self.assertTrue(PrimUpdaterManager.editAsMaya(aUsdUfePathStr))
             validateEditAsMayaMetadata()
 
         # Verify we can merge "A" Maya data after the rename of the stage.
         with mayaUsd.lib.OpUndoItemList():
             aMayaItem = ufe.GlobalSelection.get().front()
             aMayaPath = aMayaItem.path()
-            self.assertTrue(mayaUsd.lib.PrimUpdaterManager.mergeToUsd(ufe.PathString.string(aMayaPath)))
+            self.assertTrue(PrimUpdaterManager.mergeToUsd(ufe.PathString.string(aMayaPath)))
 
-    @unittest.skipIf(os.getenv('HAS_ORPHANED_NODES_MANAGER', '0') != '1', 'Test only available when UFE supports the orphaned nodes manager')
+    @unittest.skipUnless(_HAS_ORPHANED_NODES_MANAGER, 'Test only available when UFE supports the orphaned nodes manager')
     def testReparentUsdAncestorOfEditAsMaya(self):
         '''Test that reparenting an usd ancestor correctly updates the internal data.'''
-        def validateEditAsMayaMetadata(mayaItem, ufePathStr):
-            mayaPath = mayaItem.path()
-            self.assertEqual(mayaPath.nbSegments(), 1)
-            mayaToUsd = ufe.PathMappingHandler.pathMappingHandler(mayaItem)
-            fromHostUfePath = mayaToUsd.fromHost(mayaPath)
-            self.assertEqual(ufe.PathString.string(fromHostUfePath), ufePathStr)
-            dagPath = om.MSelectionList().add(ufe.PathString.string(mayaPath)).getDagPath(0)
-            pullUfePath = cmds.getAttr(str(dagPath) + ".Pull_UfePath")
-            self.assertEqual(pullUfePath, ufePathStr)
-            self.assertFalse(mayaUsd.lib.PrimUpdaterManager.canEditAsMaya(ufePathStr))
-
         def verifyDagXformAndVis(dagPath, expectedXlation, expectedVis):
             mXformMatrix = om.MTransformationMatrix(dagPath.inclusiveMatrix())
             mXlation = mXformMatrix.translation(om.MSpace.kObject)
@@ -192,23 +304,35 @@ class EditAsMayaTestCase(unittest.TestCase):
 
         (ps,
          aXlateOp, aUsdXlation, aUsdUfePathStr, _, _,
-         bXlateOp, bUsdXlation, bUsdUfePathStr, _, _) = createDuoXformScene()
+         bXlateOp, bUsdXlation, bUsdUfePathStr, _, _) = self._makeDuoXformScene()
 
         proxyShapePathStr = ufe.PathString.string(ps.path())
         stage = mayaUsd.ufe.getStage(proxyShapePathStr)
         editedPrim = stage.DefinePrim("/A/Edited", "Xform")
 
+        editedUfePathStr = "{},{}".format(proxyShapePathStr, editedPrim.GetPath())
+        self.assertTrue(PrimUpdaterManager.canEditAsMaya(editedUfePathStr))
         with mayaUsd.lib.OpUndoItemList():
-            editedUfePathStr = "{},{}".format(proxyShapePathStr, editedPrim.GetPath())
-            self.assertTrue(mayaUsd.lib.PrimUpdaterManager.canEditAsMaya(editedUfePathStr))
-            self.assertTrue(mayaUsd.lib.PrimUpdaterManager.editAsMaya(editedUfePathStr))
+            self.assertTrue(PrimUpdaterManager.editAsMaya(editedUfePathStr))
 
         editedMayaItem = ufe.GlobalSelection.get().front()
         editedMayaPathStr = ufe.PathString.string(editedMayaItem.path())
-        editedDagPath = om.MSelectionList().add(editedMayaPathStr).getDagPath(0)
+        editedDagPath = self._dagPath(editedMayaPathStr)
+
+        mayaToUsd = ufe.PathMappingHandler.pathMappingHandler(editedMayaItem)
+
+        def validateEditAsMayaMetadata(mayaItem, mayaPathStr, ufePathStr, mayaToUsd=mayaToUsd):
+            mayaPath = mayaItem.path()
+            self.assertEqual(mayaPath.nbSegments(), 1)
+            fromHostUfePath = mayaToUsd.fromHost(mayaPath)
+            self.assertEqual(ufe.PathString.string(fromHostUfePath), ufePathStr)
+            dagPath = self._dagPath(mayaPathStr)
+            pullUfePath = self._getPullUfePath(dagPath)
+            self.assertEqual(pullUfePath, ufePathStr)
+            self.assertFalse(PrimUpdaterManager.canEditAsMaya(ufePathStr))
 
         verifyDagXformAndVis(editedDagPath, aUsdXlation, True)
-        validateEditAsMayaMetadata(editedMayaItem, editedUfePathStr)
+        validateEditAsMayaMetadata(editedMayaItem, editedMayaPathStr, editedUfePathStr)
 
         # Reparent /A under /B
         cmds.parent(aUsdUfePathStr, bUsdUfePathStr)
@@ -223,11 +347,11 @@ class EditAsMayaTestCase(unittest.TestCase):
         # After reparent "/A/Edited" xform is conserved and inherits b offset
         # /B invisibility is also inherited.
         verifyDagXformAndVis(editedDagPath, aUsdXlation + bOffset, False)
-        validateEditAsMayaMetadata(editedMayaItem, bUsdUfePathStr + "/A/Edited")
+        validateEditAsMayaMetadata(editedMayaItem, editedMayaPathStr, bUsdUfePathStr + "/A/Edited")
 
         # Verify we can merge "Edited" Maya data after the reparent
         with mayaUsd.lib.OpUndoItemList():
-            self.assertTrue(mayaUsd.lib.PrimUpdaterManager.mergeToUsd(editedMayaPathStr))
+            self.assertTrue(PrimUpdaterManager.mergeToUsd(editedMayaPathStr))
 
     def testEditAsMayaPreserveUsdSkel(self):
         '''Test that edit does not change the usd skel prim data.'''
@@ -237,12 +361,12 @@ class EditAsMayaTestCase(unittest.TestCase):
         proxyShapeDagPath, usdStage = mayaUtils.createProxyFromFile(path)
 
         proxyRoot = proxyShapeDagPath + ",/Root"
-        self.assertTrue(mayaUsd.lib.PrimUpdaterManager.canEditAsMaya(proxyRoot))
-        self.assertTrue(mayaUsd.lib.PrimUpdaterManager.editAsMaya(proxyRoot))
+        self.assertTrue(PrimUpdaterManager.canEditAsMaya(proxyRoot))
+        self.assertTrue(PrimUpdaterManager.editAsMaya(proxyRoot))
 
         aMayaItem = ufe.GlobalSelection.get().front()
         options = { "writeDefaults": True, "exportSkels": "auto", "exportSkin": "auto" }
-        self.assertTrue(mayaUsd.lib.PrimUpdaterManager.mergeToUsd(ufe.PathString.string(aMayaItem.path()), options))
+        self.assertTrue(PrimUpdaterManager.mergeToUsd(ufe.PathString.string(aMayaItem.path()), options))
 
         meshPrim = usdStage.GetPrimAtPath('/Root/Cube')
         skelPrim = usdStage.GetPrimAtPath('/Root/Skeleton')
@@ -255,8 +379,7 @@ class EditAsMayaTestCase(unittest.TestCase):
     def testEditAsMayaPreserveTimeline(self):
         '''Test that edit does not change the timeline start and end.'''
 
-        (ps, aXlateOp, aXlation, aUsdUfePathStr, aUsdUfePath, aUsdItem,
-             bXlateOp, bXlation, bUsdUfePathStr, bUsdUfePath, bUsdItem) = createSimpleXformScene()
+        (_, aUsdUfePathStr, bUsdUfePathStr) = self._makeSimpleXformSceneLite()
 
         timeUnit = OM.MTime.uiUnit()
 
@@ -277,9 +400,9 @@ class EditAsMayaTestCase(unittest.TestCase):
         verifyTimeline()
 
         # Edit "B" Prim as Maya data.
+        self.assertTrue(PrimUpdaterManager.canEditAsMaya(bUsdUfePathStr))
         with mayaUsd.lib.OpUndoItemList():
-            self.assertTrue(mayaUsd.lib.PrimUpdaterManager.canEditAsMaya(bUsdUfePathStr))
-            self.assertTrue(mayaUsd.lib.PrimUpdaterManager.editAsMaya(bUsdUfePathStr))
+            self.assertTrue(PrimUpdaterManager.editAsMaya(bUsdUfePathStr))
 
         verifyTimeline()
 
@@ -287,12 +410,12 @@ class EditAsMayaTestCase(unittest.TestCase):
         '''Edit a USD transform as a Maya object.'''
 
         (ps, xlateOp, xlation, aUsdUfePathStr, aUsdUfePath, aUsdItem,
-         _, _, _, _, _) = createSimpleXformScene()
+         _, _, _, _, _) = self._makeSimpleXformScene()
 
         # Edit aPrim as Maya data.
+        self.assertTrue(PrimUpdaterManager.canEditAsMaya(aUsdUfePathStr))
         with mayaUsd.lib.OpUndoItemList():
-            self.assertTrue(mayaUsd.lib.PrimUpdaterManager.canEditAsMaya(aUsdUfePathStr))
-            self.assertTrue(mayaUsd.lib.PrimUpdaterManager.editAsMaya(aUsdUfePathStr))
+            self.assertTrue(PrimUpdaterManager.editAsMaya(aUsdUfePathStr))
 
         # Test the path mapping services.
         #
@@ -322,26 +445,18 @@ class EditAsMayaTestCase(unittest.TestCase):
 
         # Confirm the translation has been transferred, and that the local
         # transformation is only a translation.
-        aDagPath = om.MSelectionList().add(ufe.PathString.string(aMayaPath)).getDagPath(0)
-        aFn= om.MFnTransform(aDagPath)
-        self.assertEqual(aFn.translation(om.MSpace.kObject), om.MVector(*xlation))
-        mayaMatrix = aFn.transformation().asMatrix()
-        usdMatrix = xlateOp.GetOpTransform(mayaUsd.ufe.getTime(aUsdUfePathStr))
-        mayaValues = [v for v in mayaMatrix]
-        usdValues = [v for row in usdMatrix for v in row]
-
-        assertVectorAlmostEqual(self, mayaValues, usdValues)
+        self._assertXformMatches(self._dagPath(ufe.PathString.string(aMayaPath)), xlateOp, xlation, aUsdUfePathStr)
 
     def testEditAsMayaUndoRedo(self):
         '''Edit a USD transform as a Maya object and apply undo and redo.'''
 
         (ps, xlateOp, xlation, aUsdUfePathStr, aUsdUfePath, aUsdItem,
-         _, _, _, _, _) = createSimpleXformScene()
+         _, _, _, _, _) = self._makeSimpleXformScene()
 
         aPrim = mayaUsd.ufe.ufePathToPrim(aUsdUfePathStr)
 
         # Edit aPrim as Maya data.
-        self.assertTrue(mayaUsd.lib.PrimUpdaterManager.canEditAsMaya(aUsdUfePathStr))
+        self.assertTrue(PrimUpdaterManager.canEditAsMaya(aUsdUfePathStr))
 
         # Make a selection before edit as Maya.
         cmds.select('persp')
@@ -375,15 +490,7 @@ class EditAsMayaTestCase(unittest.TestCase):
 
             # Confirm the translation has been transferred, and that the local
             # transformation is only a translation.
-            aDagPath = om.MSelectionList().add(ufe.PathString.string(aMayaPath)).getDagPath(0)
-            aFn= om.MFnTransform(aDagPath)
-            self.assertEqual(aFn.translation(om.MSpace.kObject), om.MVector(*xlation))
-            mayaMatrix = aFn.transformation().asMatrix()
-            usdMatrix = xlateOp.GetOpTransform(mayaUsd.ufe.getTime(aUsdUfePathStr))
-            mayaValues = [v for v in mayaMatrix]
-            usdValues = [v for row in usdMatrix for v in row]
-
-            assertVectorAlmostEqual(self, mayaValues, usdValues)
+            self._assertXformMatches(self._dagPath(aMayaPathStr), xlateOp, xlation, aUsdUfePathStr)
 
             # Selection is on the edited Maya object.
             sn = cmds.ls(sl=True, ufe=True, long=True)
@@ -391,7 +498,7 @@ class EditAsMayaTestCase(unittest.TestCase):
             self.assertEqual(sn[0], aMayaPathStr)
 
             # Read the pull information from the pulled prim.
-            aMayaPullPathStr = mayaUsd.lib.PrimUpdaterManager.readPullInformation(aPrim)
+            aMayaPullPathStr = PrimUpdaterManager.readPullInformation(aPrim)
             self.assertEqual(aMayaPathStr, aMayaPullPathStr)
 
         verifyEditedScene()
@@ -406,7 +513,7 @@ class EditAsMayaTestCase(unittest.TestCase):
             # Selection is restored.
             self.assertEqual(cmds.ls(sl=True, ufe=True, long=True), previousSn)
             # No more pull information on the prim.
-            self.assertEqual(len(mayaUsd.lib.PrimUpdaterManager.readPullInformation(aPrim)), 0)
+            self.assertEqual(len(PrimUpdaterManager.readPullInformation(aPrim)), 0)
 
         verifyNoLongerEdited()
         
@@ -420,12 +527,10 @@ class EditAsMayaTestCase(unittest.TestCase):
         '''Edit a USD transform as a Maya Object and test the UI Info.'''
 
         # Maya UI info handler
-        rid = ufe.RunTimeMgr.instance().getId('Maya-DG')
-        ufeUIInfo = ufe.UIInfoHandler.uiInfoHandler(rid)
+        ufeUIInfo = self._mayaUIInfo
         self.assertIsNotNone(ufeUIInfo)
 
-        (ps, aXlateOp, aXlation, aUsdUfePathStr, aUsdUfePath, aUsdItem,
-             bXlateOp, bXlation, bUsdUfePathStr, bUsdUfePath, bUsdItem) = createSimpleXformScene()
+        (_, aUsdUfePathStr, bUsdUfePathStr) = self._makeSimpleXformSceneLite()
         aPrim = mayaUsd.ufe.ufePathToPrim(aUsdUfePathStr)
 
         # Edit bPrim as Maya data. This will auto-select the item after so get the Maya scene item
@@ -478,30 +583,31 @@ class EditAsMayaTestCase(unittest.TestCase):
 
         blendShapePathStr = proxyShapePathStr + ',/BlendShape1'
         scopePathStr = proxyShapePathStr + ',/Scope1'
+        meshPathStr = proxyShapePathStr + ',/Mesh1'
+        materialPathStr = proxyShapePathStr + ',/Material1'
+        instanceProxyPathStr = proxyShapePathStr + ',/Instanced/Proto/Mesh'
 
         # Blend shape cannot be edited as Maya: it has no importer.
+        self.assertFalse(PrimUpdaterManager.canEditAsMaya(blendShapePathStr))
         with mayaUsd.lib.OpUndoItemList():
-            self.assertFalse(mayaUsd.lib.PrimUpdaterManager.canEditAsMaya(blendShapePathStr))
-            self.assertFalse(mayaUsd.lib.PrimUpdaterManager.editAsMaya(blendShapePathStr))
+            self.assertFalse(PrimUpdaterManager.editAsMaya(blendShapePathStr))
 
         # Scope cannot be edited as Maya: it has no exporter.
         # Unfortunately, as of 17-Nov-2021, we cannot determine how a prim will
         # round-trip, so we cannot use the information that scope has no
         # exporter.
         # with mayaUsd.lib.OpUndoItemList():
-        #     self.assertFalse(mayaUsd.lib.PrimUpdaterManager.canEditAsMaya(scopePathStr))
-        #     self.assertFalse(mayaUsd.lib.PrimUpdaterManager.editAsMaya(scopePathStr))
+        #     self.assertFalse(PrimUpdaterManager.canEditAsMaya(scopePathStr))
+        #     self.assertFalse(PrimUpdaterManager.editAsMaya(scopePathStr))
         
         # Mesh can be edited as Maya.
-        self.assertTrue(mayaUsd.lib.PrimUpdaterManager.canEditAsMaya(proxyShapePathStr + ',/Mesh1'))
-
-        # Material cannot be edited as Maya: it explicitly disables this
-        # capability.
-        self.assertFalse(mayaUsd.lib.PrimUpdaterManager.canEditAsMaya(proxyShapePathStr + ',/Material1'))
+        self.assertTrue(PrimUpdaterManager.canEditAsMaya(meshPathStr))
 
-        # Instance proxies cannot be edited as Maya: it explicitly disables this
-        # capability.
-        self.assertFalse(mayaUsd.lib.PrimUpdaterManager.canEditAsMaya(proxyShapePathStr + ',/Instanced/Proto/Mesh'))
+        # Material and instance proxies cannot be edited as Maya: they
+        # explicitly disable this capability.
+        for pathStr in (materialPathStr, instanceProxyPathStr):
+            with self.subTest(pathStr):
+                self.assertFalse(PrimUpdaterManager.canEditAsMaya(pathStr))
 
     def testSessionLayer(self):
         '''Verify that the edit gets on the sessionLayer instead of the editTarget layer.'''
@@ -517,9 +623,9 @@ class EditAsMayaTestCase(unittest.TestCase):
 
         self.assertTrue(stage.GetSessionLayer().empty)
 
+        self.assertTrue(PrimUpdaterManager.canEditAsMaya(primPathStr))
         with mayaUsd.lib.OpUndoItemList():
-            self.assertTrue(mayaUsd.lib.PrimUpdaterManager.canEditAsMaya(primPathStr))
-            self.assertTrue(mayaUsd.lib.PrimUpdaterManager.editAsMaya(primPathStr))
+            self.assertTrue(PrimUpdaterManager.editAsMaya(primPathStr))
 
         self.assertFalse(stage.GetSessionLayer().empty)
 
@@ -528,7 +634,7 @@ class EditAsMayaTestCase(unittest.TestCase):
 
         # Discard Maya edits, but there is nothing to discard.
         with mayaUsd.lib.OpUndoItemList():
-            self.assertTrue(mayaUsd.lib.PrimUpdaterManager.discardEdits("A"))
+            self.assertTrue(PrimUpdaterManager.discardEdits("A"))
 
         self.assertTrue(stage.GetSessionLayer().empty)
 
@@ -561,9 +667,9 @@ class EditAsMayaTestCase(unittest.TestCase):
         currentLayer = stage.GetEditTarget().GetLayer()
         self.assertEqual(currentLayer, otherLayer) # Current layer should be the Other Layer
 
+        self.assertTrue(PrimUpdaterManager.canEditAsMaya(primPathStr))
         with mayaUsd.lib.OpUndoItemList():
-            self.assertTrue(mayaUsd.lib.PrimUpdaterManager.canEditAsMaya(primPathStr))
-            self.assertTrue(mayaUsd.lib.PrimUpdaterManager.editAsMaya(primPathStr))
+            self.assertTrue(PrimUpdaterManager.editAsMaya(primPathStr))
 
         self.assertFalse(stage.GetSessionLayer().empty)
 
@@ -31,6 +31,13 @@ import os
 
 import unittest
 
+# Optional light interfaces, which a light only provides if its type supports them.
+INTERFACES = ('cone', 'sphere', 'directional', 'area')
+VOLUME_INTERFACES = ('cylinder', 'disk', 'dome')
+
+# Volume light interfaces are only provided by the version 5.5 light class.
+VOLUME_LIGHT_CLASS = ufe.Light_v5_5 if hasattr(ufe, "Light_v5_5") else ufe.Light
+
 class LightTestCase(unittest.TestCase):
     '''Verify the Light UFE translate interface, for multiple runtimes.
     
@@ -47,6 +54,10 @@ class LightTestCase(unittest.TestCase):
     '''
 
     pluginsLoaded = False
+
+    # SimpleLight proxy shape and stage shared by the tests which do not
+    # depend on each other's edits to the stage.
+    _sharedSimpleLight = None
     
     @classmethod
     def setUpClass(cls):
@@ -54,22 +65,16 @@ class LightTestCase(unittest.TestCase):
 
         if not cls.pluginsLoaded:
             cls.pluginsLoaded = mayaUtils.isMayaUsdPluginLoaded()
+        assert cls.pluginsLoaded, "Maya USD plugin failed to load"
 
     @classmethod
     def tearDownClass(cls):
         standalone.uninitialize()
 
-    def setUp(self):
-        ''' Called initially to set up the maya test environment '''
-        # Load plugins
-        self.assertTrue(self.pluginsLoaded)
-
-        # value from UsdGeomLinearUnits
-        self.inchesToCm = 2.54
-        self.mmToCm = 0.1
-
     def _StartTest(self, testName):
         cmds.file(force=True, new=True)
+        # The new file removes any shared proxy shape.
+        LightTestCase._sharedSimpleLight = None
         self._testName = testName
         testFile = testUtils.getTestScene("light", self._testName + ".usda")
         shapeNode, shapeStage = mayaUtils.createProxyFromFile(testFile)
@@ -77,93 +82,35 @@ class LightTestCase(unittest.TestCase):
         globalSelection.clear()
         return shapeNode, shapeStage
 
-    def _TestSpotLight(self, ufeLight, usdLight):
-        # Trust that the USD API works correctly, validate that UFE gives us
-        # the same answers
-        self.assertEqual(ufeLight.type(), ufe.Light.Spot)
-        self._TestIntensity(ufeLight, usdLight)
-        self._TestDiffuse(ufeLight, usdLight)
-        self._TestSpecular(ufeLight, usdLight)
-        self._TestShadowEnable(ufeLight, usdLight)
-        self._TestColor(ufeLight, usdLight)
-        self._TestShadowColor(ufeLight, usdLight)
-        self._TestSphereProps(ufeLight, usdLight)
-        self._TestConeProps(ufeLight, usdLight)
-        self.assertEqual(None, ufeLight.directionalInterface())
-        self.assertEqual(None, ufeLight.areaInterface())
-
-    def _TestPointLight(self, ufeLight, usdLight):
-        # Trust that the USD API works correctly, validate that UFE gives us
-        # the same answers
-        if (os.getenv('UFE_VOLUME_LIGHTS_SUPPORT', 'FALSE') == 'TRUE'):
-            # With Ufe volume light support point light will be treated as a special kind of
-            # sphere light where the gizmo will be handled in Maya.
-            self.assertEqual(ufeLight.type(), ufe.Light.Sphere)
+    def _StartSharedSimpleLightTest(self):
+        '''Same as _StartTest('SimpleLight'), but reuses the proxy shape loaded
+        by a previous test if it still exists.'''
+        sharedSimpleLight = LightTestCase._sharedSimpleLight
+        if sharedSimpleLight is None or not cmds.objExists(sharedSimpleLight[0]):
+            sharedSimpleLight = self._StartTest('SimpleLight')
+            LightTestCase._sharedSimpleLight = sharedSimpleLight
         else:
-            self.assertEqual(ufeLight.type(), ufe.Light.Point)
-        self._TestIntensity(ufeLight, usdLight)
-        self._TestDiffuse(ufeLight, usdLight)
-        self._TestSpecular(ufeLight, usdLight)
-        self._TestShadowEnable(ufeLight, usdLight)
-        self._TestColor(ufeLight, usdLight)
-        self._TestShadowColor(ufeLight, usdLight)
-        self._TestSphereProps(ufeLight, usdLight)
-        self.assertEqual(None, ufeLight.coneInterface())
-        self.assertEqual(None, ufeLight.directionalInterface())
-        self.assertEqual(None, ufeLight.areaInterface())
-
-    def _TestDirectionalLight(self, ufeLight, usdLight):
-        # Trust that the USD API works correctly, validate that UFE gives us
-        # the same answers
-        self.assertEqual(ufeLight.type(), ufe.Light.Directional)
-        self._TestIntensity(ufeLight, usdLight)
-        self._TestDiffuse(ufeLight, usdLight)
-        self._TestSpecular(ufeLight, usdLight)
-        self._TestShadowEnable(ufeLight, usdLight)
-        self._TestColor(ufeLight, usdLight)
-        self._TestShadowColor(ufeLight, usdLight)
-        self._TestDirectionalProps(ufeLight, usdLight)
-        self.assertEqual(None, ufeLight.coneInterface())
-        self.assertEqual(None, ufeLight.sphereInterface())
-        self.assertEqual(None, ufeLight.areaInterface())
-
-    def _TestAreaLight(self, ufeLight, usdLight):
-        # Trust that the USD API works correctly, validate that UFE gives us
-        # the same answers
-        self.assertEqual(ufeLight.type(), ufe.Light.Area)
-        self._TestIntensity(ufeLight, usdLight)
-        self._TestDiffuse(ufeLight, usdLight)
-        self._TestSpecular(ufeLight, usdLight)
-        self._TestShadowEnable(ufeLight, usdLight)
-        self._TestColor(ufeLight, usdLight)
-        self._TestShadowColor(ufeLight, usdLight)
-        self._TestAreaProps(ufeLight, usdLight)
-        self.assertEqual(None, ufeLight.coneInterface())
-        self.assertEqual(None, ufeLight.sphereInterface())
-        self.assertEqual(None, ufeLight.directionalInterface())
-
-    # Test VolumeLight support
-    def _TestCylinderLight(self, ufeLight, usdLight):
-        # Trust that the USD API works correctly, validate that UFE gives us
-        # the same answers
-        self.assertEqual(ufeLight.type(), ufe.Light.Cylinder)
-        self.assertEqual(None, ufeLight.diskInterface())
-        self.assertEqual(None, ufeLight.domeInterface())
-   
-    def _TestDiskLight(self, ufeLight, usdLight):
-        # Trust that the USD API works correctly, validate that UFE gives us
-        # the same answers
-        self.assertEqual(ufeLight.type(), ufe.Light.Disk)
-        self.assertEqual(None, ufeLight.cylinderInterface())
-        self.assertEqual(None, ufeLight.domeInterface())
+            ufe.GlobalSelection.get().clear()
+        return sharedSimpleLight
 
-    def _TestDomeLight(self, ufeLight, usdLight):
+    def _ResolveLight(self, mayaPathSegment, usdPath, lightClass=ufe.Light):
+        '''Return the UFE light and the USD prim of the light at the given USD
+        path under the proxy shape with the given Maya path segment.'''
+        usdPathSegment = usdUtils.createUfePathSegment(usdPath)
+        lightItem = ufe.Hierarchy.createItem(ufe.Path([mayaPathSegment, usdPathSegment]))
+        return lightClass.light(lightItem), usdUtils.getPrimFromSceneItem(lightItem)
+
+    def _TestLight(self, ufeLight, usdLight, expectedType, interfaces, activeInterfaces, checkers):
         # Trust that the USD API works correctly, validate that UFE gives us
         # the same answers
-        self.assertEqual(ufeLight.type(), ufe.Light.Dome)
-        self.assertEqual(None, ufeLight.cylinderInterface())
-        self.assertEqual(None, ufeLight.diskInterface())
-    
+        self.assertEqual(ufeLight.type(), expectedType)
+        for checker in checkers:
+            checker(ufeLight, usdLight)
+        # The interfaces the light type does not support must not be provided.
+        for name in interfaces:
+            if name not in activeInterfaces:
+                self.assertIsNone(getattr(ufeLight, name + 'Interface')())
+
     def _TestIntensity(self, ufeLight, usdLight):
         usdAttr = usdLight.GetAttribute('inputs:intensity')
         self.assertAlmostEqual(usdAttr.Get(), ufeLight.intensity())
@@ -199,35 +146,35 @@ class LightTestCase(unittest.TestCase):
         self.assertEqual(usdAttr.Get(), ufeLight.shadowEnable())
 
         usdAttr.Set(False)
-        self.assertEqual(False, ufeLight.shadowEnable())
+        self.assertFalse(ufeLight.shadowEnable())
 
         ufeLight.shadowEnable(True)
-        self.assertAlmostEqual(usdAttr.Get(), True)        
+        self.assertTrue(usdAttr.Get())
 
     def _TestColor(self, ufeLight, usdLight):
-        usdAttr = usdLight.GetAttribute('inputs:color')
-        self.assertAlmostEqual(usdAttr.Get()[0], ufeLight.color().r())
-        self.assertAlmostEqual(usdAttr.Get()[1], ufeLight.color().g())
-        self.assertAlmostEqual(usdAttr.Get()[2], ufeLight.color().b())
+        usdColor = usdLight.GetAttribute('inputs:color').Get()
+        ufeColor = ufeLight.color()
+        testUtils.assertVectorAlmostEqual(self, usdColor, (ufeColor.r(), ufeColor.g(), ufeColor.b()))
 
     def _TestShadowColor(self, ufeLight, usdLight):
-        usdAttr = usdLight.GetAttribute('inputs:shadow:color')
-        self.assertAlmostEqual(usdAttr.Get()[0], ufeLight.shadowColor().r())
-        self.assertAlmostEqual(usdAttr.Get()[1], ufeLight.shadowColor().g())
-        self.assertAlmostEqual(usdAttr.Get()[2], ufeLight.shadowColor().b())
+        usdColor = usdLight.GetAttribute('inputs:shadow:color').Get()
+        ufeColor = ufeLight.shadowColor()
+        testUtils.assertVectorAlmostEqual(self, usdColor, (ufeColor.r(), ufeColor.g(), ufeColor.b()))
 
     def _TestSphereProps(self, ufeLight, usdLight):
-        usdAttr = usdLight.GetAttribute('inputs:radius')
-        self.assertAlmostEqual(usdAttr.Get(), ufeLight.sphereInterface().sphereProps().radius)
-        self.assertEqual(usdAttr.Get() == 0, ufeLight.sphereInterface().sphereProps().asPoint)
+        usdRadius = usdLight.GetAttribute('inputs:radius').Get()
+        sphereProps = ufeLight.sphereInterface().sphereProps()
+        self.assertAlmostEqual(usdRadius, sphereProps.radius)
+        self.assertEqual(usdRadius == 0, sphereProps.asPoint)
 
     def _TestConeProps(self, ufeLight, usdLight):
         usdAttrFocus = usdLight.GetAttribute('inputs:shaping:focus')
         usdAttrAngle = usdLight.GetAttribute('inputs:shaping:cone:angle')
         usdAttrSoftness = usdLight.GetAttribute('inputs:shaping:cone:softness')
-        self.assertAlmostEqual(usdAttrFocus.Get(), ufeLight.coneInterface().coneProps().focus)
-        self.assertAlmostEqual(usdAttrAngle.Get(), ufeLight.coneInterface().coneProps().angle)
-        self.assertAlmostEqual(usdAttrSoftness.Get(), ufeLight.coneInterface().coneProps().softness)
+        coneProps = ufeLight.coneInterface().coneProps()
+        self.assertAlmostEqual(usdAttrFocus.Get(), coneProps.focus)
+        self.assertAlmostEqual(usdAttrAngle.Get(), coneProps.angle)
+        self.assertAlmostEqual(usdAttrSoftness.Get(), coneProps.softness)
 
     def _TestDirectionalProps(self, ufeLight, usdLight):
         usdAttr = usdLight.GetAttribute('inputs:angle')
@@ -238,90 +185,57 @@ class LightTestCase(unittest.TestCase):
         self.assertEqual(usdAttr.Get(), ufeLight.areaInterface().normalize())        
 
     def testUsdLight(self):
-        shapeNode, _ = self._StartTest('SimpleLight')
-
+        # Note: this test edits the lights it checks, which are not the ones
+        #       checked by testUsdVolumeLights, so the proxy can be shared.
+        shapeNode, _ = self._StartSharedSimpleLightTest()
         mayaPathSegment = mayaUtils.createUfePathSegment(shapeNode)
-        
-        # test spot light
-        spotlightUsdPathSegment = usdUtils.createUfePathSegment('/lights/spotLight')
-        spotlightPath = ufe.Path([mayaPathSegment, spotlightUsdPathSegment])
-        spotlightItem = ufe.Hierarchy.createItem(spotlightPath)
-
-        ufeSpotLight = ufe.Light.light(spotlightItem)
-        usdSpotLight = usdUtils.getPrimFromSceneItem(spotlightItem)
-        self._TestSpotLight(ufeSpotLight, usdSpotLight)
-
-        # test point light
-        pointlightUsdPathSegment = usdUtils.createUfePathSegment('/lights/pointLight')
-        pointlightPath = ufe.Path([mayaPathSegment, pointlightUsdPathSegment])
-        pointlightItem = ufe.Hierarchy.createItem(pointlightPath)
-
-        ufePointLight = ufe.Light.light(pointlightItem)
-        usdPointLight = usdUtils.getPrimFromSceneItem(pointlightItem)
-        self._TestPointLight(ufePointLight, usdPointLight)        
-
-        # test directional light
-        directionallightUsdPathSegment = usdUtils.createUfePathSegment('/lights/directionalLight')
-        directionallightPath = ufe.Path([mayaPathSegment, directionallightUsdPathSegment])
-        directionallightItem = ufe.Hierarchy.createItem(directionallightPath)
-
-        ufeDirectionalLight = ufe.Light.light(directionallightItem)
-        usdDirectionalLight = usdUtils.getPrimFromSceneItem(directionallightItem)
-        self._TestDirectionalLight(ufeDirectionalLight, usdDirectionalLight)
-
-        # test area light
-        arealightUsdPathSegment = usdUtils.createUfePathSegment('/lights/areaLight')
-        arealightPath = ufe.Path([mayaPathSegment, arealightUsdPathSegment])
-        arealightItem = ufe.Hierarchy.createItem(arealightPath)
-
-        ufeAreaLight = ufe.Light.light(arealightItem)
-        usdAreaLight = usdUtils.getPrimFromSceneItem(arealightItem)
-        self._TestAreaLight(ufeAreaLight, usdAreaLight)
+
+        if (os.getenv('UFE_VOLUME_LIGHTS_SUPPORT', 'FALSE') == 'TRUE'):
+            # With Ufe volume light support point light will be treated as a special kind of
+            # sphere light where the gizmo will be handled in Maya.
+            pointLightType = ufe.Light.Sphere
+        else:
+            pointLightType = ufe.Light.Point
+
+        commonCheckers = (self._TestIntensity, self._TestDiffuse, self._TestSpecular,
+                          self._TestShadowEnable, self._TestColor, self._TestShadowColor)
+        lights = (
+            ('/lights/spotLight', ufe.Light.Spot, {'sphere', 'cone'},
+             (self._TestSphereProps, self._TestConeProps)),
+            ('/lights/pointLight', pointLightType, {'sphere'},
+             (self._TestSphereProps,)),
+            ('/lights/directionalLight', ufe.Light.Directional, {'directional'},
+             (self._TestDirectionalProps,)),
+            ('/lights/areaLight', ufe.Light.Area, {'area'},
+             (self._TestAreaProps,)),
+        )
+        for usdPath, lightType, activeInterfaces, checkers in lights:
+            with self.subTest(usdPath):
+                ufeLight, usdLight = self._ResolveLight(mayaPathSegment, usdPath)
+                self._TestLight(ufeLight, usdLight, lightType, INTERFACES, activeInterfaces,
+                                commonCheckers + checkers)
 
     @unittest.skipUnless(os.getenv('UFE_VOLUME_LIGHTS_SUPPORT', 'FALSE') == 'TRUE', 'UFE has volume light support.')
     def testUsdVolumeLights(self):
-        shapeNode, _ = self._StartTest('SimpleLight')
+        shapeNode, _ = self._StartSharedSimpleLightTest()
         mayaPathSegment = mayaUtils.createUfePathSegment(shapeNode)
-        # test cylinder light
-        cylinderlightUsdPathSegment = usdUtils.createUfePathSegment('/lights/cylinderLight')
-        cylinderlightPath = ufe.Path([mayaPathSegment, cylinderlightUsdPathSegment])
-        cylinderlightItem = ufe.Hierarchy.createItem(cylinderlightPath)
-
-        if (hasattr(ufe, "Light_v5_5")):
-            ufeCylinderLight = ufe.Light_v5_5.light(cylinderlightItem)
-        else:
-            ufeCylinderLight = ufe.Light.light(cylinderlightItem)
-        usdCylinderLight = usdUtils.getPrimFromSceneItem(cylinderlightItem)
-        self._TestCylinderLight(ufeCylinderLight, usdCylinderLight)
 
-        # test disk light
-        disklightUsdPathSegment = usdUtils.createUfePathSegment('/lights/diskLight')
-        disklightPath = ufe.Path([mayaPathSegment, disklightUsdPathSegment])
-        disklightItem = ufe.Hierarchy.createItem(disklightPath)
-
-        if (hasattr(ufe, "Light_v5_5")):
-            ufeDiskLight = ufe.Light_v5_5.light(disklightItem)
-        else:
-            ufeDiskLight = ufe.Light.light(disklightItem)
-        usdDiskLight = usdUtils.getPrimFromSceneItem(disklightItem)
-        self._TestDiskLight(ufeDiskLight, usdDiskLight)
-
-        # test dome light
-        domelightUsdPathSegment = usdUtils.createUfePathSegment('/lights/domeLight')
-        domelightPath = ufe.Path([mayaPathSegment, domelightUsdPathSegment])
-        domelightItem = ufe.Hierarchy.createItem(domelightPath)
-
-        if (hasattr(ufe, "Light_v5_5")):
-            ufeDomeLight = ufe.Light_v5_5.light(domelightItem)
-        else:
-            ufeDomeLight = ufe.Light.light(domelightItem)
-        usdDomeLight = usdUtils.getPrimFromSceneItem(domelightItem)
-        self._TestDomeLight(ufeDomeLight, usdDomeLight)
+        lights = (
+            ('/lights/cylinderLight', ufe.Light.Cylinder, {'cylinder'}),
+            ('/lights/diskLight', ufe.Light.Disk, {'disk'}),
+            ('/lights/domeLight', ufe.Light.Dome, {'dome'}),
+        )
+        for usdPath, lightType, activeInterfaces in lights:
+            with self.subTest(usdPath):
+                ufeLight, usdLight = self._ResolveLight(mayaPathSegment, usdPath, VOLUME_LIGHT_CLASS)
+                self._TestLight(ufeLight, usdLight, lightType, VOLUME_INTERFACES, activeInterfaces, ())
 
     def testLoadingLight(self):
         '''
         Verify that the act of loading a stage with lights does not dirty the stage.
         '''
+        # Note: this test needs a freshly loaded stage, so it cannot use the
+        #       shared proxy shape.
         shapeNode, stage = self._StartTest('SimpleLight')
         mayaPathSegment = mayaUtils.createUfePathSegment(shapeNode)
 
@@ -333,11 +247,7 @@ class LightTestCase(unittest.TestCase):
         verifyClean()
 
         # Access the cylinder light shadow enable attribute.
-        noAttrlightUsdPathSegment = usdUtils.createUfePathSegment('/lights/noAttrLight')
-        noAttrlightPath = ufe.Path([mayaPathSegment, noAttrlightUsdPathSegment])
-        noAttrlightItem = ufe.Hierarchy.createItem(noAttrlightPath)
-
-        ufeLight = ufe.Light.light(noAttrlightItem)
+        ufeLight, _ = self._ResolveLight(mayaPathSegment, '/lights/noAttrLight')
         self.assertFalse(ufeLight.shadowEnable())
 
         verifyClean()
@@ -22,11 +22,12 @@ from maya import standalone
 from maya import cmds
 import mayaUtils
 
-from pxr import Usd
+from pxr import Usd, Sdf
 import ufe
 
 from mayaUsd import lib as mayaUsdLib
 
+import collections
 import os
 import sys
 import unittest
@@ -39,28 +40,39 @@ class TestSceneItem(ufe.SceneItem):
         return "TestSceneItem"
 
 class TestObserver(ufe.Observer):
+    # Notification classes counted by the observer, with the counter each of
+    # them increments.
+    _COUNTED = (
+        (ufe.ObjectAdd, 'add'),
+        (ufe.ObjectDelete, 'delete'),
+        (ufe.ObjectPathChange, 'pathChange'),
+        (ufe.SubtreeInvalidate, 'subtreeInvalidate'),
+        (ufe.SceneCompositeNotification, 'composite'),
+    )
+
+    # Counters incremented by each notification type seen so far. The type is
+    # only matched against _COUNTED the first time it is seen, so that
+    # subclasses such as ObjectPostDelete are still counted.
+    _dispatch = {}
+
     def __init__(self):
-        self.add = 0
-        self.delete = 0
-        self.pathChange = 0
-        self.subtreeInvalidate = 0
-        self.composite = 0
+        self._counters = collections.Counter()
         super(TestObserver, self).__init__()
 
     def __call__(self, notification):
-        if isinstance(notification, ufe.ObjectAdd):
-            self.add += 1
-        if isinstance(notification, ufe.ObjectDelete):
-            self.delete += 1
-        if isinstance(notification, ufe.ObjectPathChange):
-            self.pathChange += 1
-        if isinstance(notification, ufe.SubtreeInvalidate):
-            self.subtreeInvalidate += 1
-        if isinstance(notification, ufe.SceneCompositeNotification):
-            self.composite += 1
-
-    def notifications(self):
-        return [self.add, self.delete, self.pathChange, self.subtreeInvalidate, self.composite]
+        notificationType = type(notification)
+        keys = TestObserver._dispatch.get(notificationType)
+        if keys is None:
+            keys = tuple(key for cls, key in TestObserver._COUNTED
+                         if issubclass(notificationType, cls))
+            TestObserver._dispatch[notificationType] = keys
+        for key in keys:
+            self._counters[key] += 1
+
+    def counts(self):
+        '''Return a copy of the notification counts, keyed by counter name.
+        Counters which were never incremented have no entry.'''
+        return collections.Counter(self._counters)
 
 class UFEObservableSceneTest(unittest.TestCase):
     
@@ -77,13 +89,6 @@ class UFEObservableSceneTest(unittest.TestCase):
     def tearDownClass(cls):
         standalone.uninitialize()
 
-    def checkNotifications(self, testObserver, listNotifications):
-        self.assertTrue(testObserver.add == listNotifications[0])
-        self.assertTrue(testObserver.delete == listNotifications[1])
-        self.assertTrue(testObserver.pathChange == listNotifications[2])
-        self.assertTrue(testObserver.subtreeInvalidate == listNotifications[3])
-        self.assertTrue(testObserver.composite == listNotifications[4])
-
     def testObservableScene(self):
         # Setup
         ca = ufe.PathComponent("a")
@@ -113,7 +118,7 @@ class UFEObservableSceneTest(unittest.TestCase):
         ufe.Scene.addObserver(snObs)
 
         # Order of expected notifications. No notifications yet.
-        self.checkNotifications(snObs, [0,0,0,0,0,0])
+        self.assertEqual(snObs.counts(), collections.Counter())
 
         self.assertEqual(ufe.Scene.nbObservers() - initialNbObservers, 1)
         self.assertTrue(ufe.Scene.hasObserver(snObs))
@@ -121,7 +126,7 @@ class UFEObservableSceneTest(unittest.TestCase):
         ufe.Scene.notify(ufe.ObjectAdd(itemA))
 
         # we should now have an ObjectAdd notification
-        self.checkNotifications(snObs, [1,0,0,0,0,0])
+        self.assertEqual(snObs.counts(), collections.Counter(add=1))
 
         # HS 2020: can't pass ufe.scene to NotificationGuard??
         
@@ -134,16 +139,16 @@ class UFEObservableSceneTest(unittest.TestCase):
         
         cmds.file(new=True, force=True)
         
-        usdFilePath = cmds.internalVar(utd=1) + '/testInertPrimAddRemove.usda'
-        stage = Usd.Stage.CreateNew(usdFilePath)
+        # Create the stage in memory, there is no need to write it to disk.
+        rootLayer = Sdf.Layer.CreateAnonymous('testInertPrimAddRemove.usda')
+        stage = Usd.Stage.Open(rootLayer)
         
         fooPath = '/foo'
         stage.DefinePrim(fooPath, 'Xform')
         
-        # Save out the file, and bring it back into Maya under a proxy shape.
-        stage.GetRootLayer().Save()
+        # Bring the anonymous layer into Maya under a proxy shape.
         proxyShape = cmds.createNode('mayaUsdProxyShape')
-        cmds.setAttr('mayaUsdProxyShape1.filePath', usdFilePath, type='string')
+        cmds.setAttr('mayaUsdProxyShape1.filePath', rootLayer.identifier, type='string')
 
         stage = mayaUsdLib.GetPrim(proxyShape).GetStage()
 
@@ -157,12 +162,12 @@ class UFEObservableSceneTest(unittest.TestCase):
         # Deactivate the prim...expect object delete notif.
         fooPrim = stage.GetPrimAtPath(fooPath)
         fooPrim.SetActive(False)
-        self.checkNotifications(snObs, [0,1,0,0,0,0])
+        self.assertEqual(snObs.counts(), collections.Counter(delete=1))
         
         # Clear session layer, expect an object added notif, as the inactive
         # state was cleared from the session layer.
         sessionLayer.Clear()
-        self.checkNotifications(snObs, [1,1,0,0,0,0])
+        self.assertEqual(snObs.counts(), collections.Counter(add=1, delete=1))
         
 
 if __name__ == '__main__':